@@ -5,12 +5,15 @@ from app.core.config import get_settings
 router = APIRouter()
 settings = get_settings()
 
+# Static payload, built once (liveness probes hit this endpoint frequently)
+_HEALTH_PAYLOAD = {
+    "status": "ok",
+    "app": settings.APP_NAME,
+    "version": settings.VERSION
+}
+
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "ok",
-        "app": settings.APP_NAME,
-        "version": settings.VERSION
-    }
+    return _HEALTH_PAYLOAD
@@ -1,22 +1,222 @@
 """Simulation API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from uuid import UUID
+import asyncio
+import time
+import numpy as np
+import orjson
+from collections import OrderedDict
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from datetime import datetime
+from sqlalchemy import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import AsyncIterator, Optional
+from uuid import UUID, uuid4
 
-from app.core.db import get_session
+from app.core.db import engine, get_session
+from app.core.executor import get_executor
 from app.models.snapshot import Snapshot
-from app.models.run import SimulationRun, SimulationRequest, SimulationResponse, SimulationResult
+from app.models.types import uuid7
+from app.models.run import (
+    SimulationRun,
+    SimulationRequest,
+    SimulationResponse,
+    pack_results_json,
+    unpack_results_json,
+)
 from app.domain.scenarios import get_default_scenarios, get_scenario_params
-from app.domain.simulator import FinancialSimulator, SimulationInput, calculate_risk_level
+from app.domain.simulator import (
+    SimulationInput,
+    SimulationOutput,
+    calculate_risk_level,
+    simulate_batch,
+)
 from app.domain.levers import calculate_levers
 
 router = APIRouter(prefix="/simulate", tags=["simulation"])
 
+# Background simulation jobs: task_id -> {"status": ..., "result"/"error": ...}.
+# In-process only; multi-worker deployments need a shared store (e.g. Redis).
+_simulation_tasks: dict[UUID, dict] = {}
+
+# Finished jobs are kept for polling for this long, and at most this many
+_FINISHED_TASK_TTL_SECONDS = 3600.0
+_MAX_FINISHED_TASKS = 1000
+
+# Expiry time of each finished job, oldest first
+_finished_task_expiry: OrderedDict[UUID, float] = OrderedDict()
+
+# Streaming simulations still computing or storing their runs
+_stream_tasks: set[asyncio.Task] = set()
+
+
+def _prepare_scenarios(
+    snapshot: Snapshot,
+    scenarios: Optional[list[dict]]
+) -> tuple[SimulationInput, list[tuple[str, dict]], list[SimulationOutput]]:
+    """Resolve the requested (or default) scenarios and simulate them in one batch."""
+    # Prepare simulation input
+    sim_input = SimulationInput(
+        monthly_income_takehome=snapshot.monthly_income_takehome,
+        emergency_fund_balance=snapshot.emergency_fund_balance,
+        essential_total=snapshot.essential_total,
+        discretionary_total=snapshot.discretionary_total,
+        horizon_months=12
+    )
+    
+    # Determine which scenarios to run
+    scenarios_to_run = scenarios if scenarios else get_default_scenarios()
+    
+    # Get final params (merge custom with defaults)
+    scenario_jobs = [
+        (scenario["type"], get_scenario_params(scenario["type"], scenario.get("params", {})))
+        for scenario in scenarios_to_run
+    ]
+    
+    # Simulate all scenarios in one vectorized batch
+    return sim_input, scenario_jobs, simulate_batch(sim_input, scenario_jobs)
+
+
+def _build_result(
+    scenario_type: str,
+    scenario_params: dict,
+    sim_output: SimulationOutput,
+    levers: list[dict],
+    total_expenses: float
+) -> dict:
+    """
+    Build one result payload.
+    
+    Every field is already a Python primitive, so the dict (same fields as
+    SimulationResult) is built directly rather than validated and dumped
+    through the model.
+    """
+    return {
+        "scenario_type": scenario_type,
+        "scenario_params": scenario_params,
+        "runway_months": round(sim_output.runway_months, 2),
+        "breach_month": sim_output.breach_month,
+        "balance_series": np.round(sim_output.balance_series, 2).tolist(),
+        "risk_level": calculate_risk_level(sim_output.runway_months, total_expenses),
+        "min_balance": round(sim_output.min_balance, 2),
+        "ending_balance": round(sim_output.ending_balance, 2),
+        "top_levers": levers,
+    }
+
+
+async def _store_results(snapshot: Snapshot, results: list[dict], session: AsyncSession) -> None:
+    """Save result payloads as simulation runs with one multi-row INSERT."""
+    runs_to_insert = [
+        {
+            "id": uuid7(),
+            "snapshot_id": snapshot.id,
+            "created_at": datetime.utcnow(),
+            "scenario_type": result["scenario_type"],
+            "scenario_params_json": result["scenario_params"],
+            "results_json": pack_results_json(result),
+        }
+        for result in results
+    ]
+    
+    # Bypass the ORM unit of work; DB work stays on the event loop
+    await session.exec(insert(SimulationRun), params=runs_to_insert)
+    await session.commit()
+
+
+async def _run_scenarios(
+    snapshot: Snapshot,
+    scenarios: Optional[list[dict]],
+    session: AsyncSession
+) -> dict:
+    """
+    Simulate the requested (or default) scenarios and store the runs.
+    
+    Returns the SimulationResponse payload as plain JSON-ready dicts.
+    """
+    sim_input, scenario_jobs, sim_outputs = _prepare_scenarios(snapshot, scenarios)
+    
+    # Calculate levers per scenario in parallel off the event loop
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    scenario_levers = await asyncio.gather(*(
+        loop.run_in_executor(
+            executor, calculate_levers, sim_input, scenario_type, scenario_params, sim_output
+        )
+        for (scenario_type, scenario_params), sim_output in zip(scenario_jobs, sim_outputs)
+    ))
+    
+    total_expenses = snapshot.essential_total + snapshot.discretionary_total
+    results = [
+        _build_result(scenario_type, scenario_params, sim_output, levers, total_expenses)
+        for (scenario_type, scenario_params), sim_output, levers in zip(
+            scenario_jobs, sim_outputs, scenario_levers
+        )
+    ]
+    
+    await _store_results(snapshot, results, session)
+    
+    return {"snapshot_id": str(snapshot.id), "results": results}
+
+
+async def _compute_and_store_streamed(
+    snapshot: Snapshot,
+    sim_input: SimulationInput,
+    scenario_jobs: list[tuple[str, dict]],
+    sim_outputs: list[SimulationOutput],
+    queue: asyncio.Queue
+) -> None:
+    """
+    Compute each scenario's result for a stream, then store all runs.
+    
+    Results are put on the queue in completion order. After the runs are
+    stored comes None, or, if anything failed, an {"error": ...} payload and
+    then None. Runs as its own task so the runs are still stored if the
+    client disconnects mid-stream.
+    """
+    total_expenses = snapshot.essential_total + snapshot.discretionary_total
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    
+    async def scenario_result(index: int) -> tuple[int, dict]:
+        (scenario_type, scenario_params), sim_output = scenario_jobs[index], sim_outputs[index]
+        levers = await loop.run_in_executor(
+            executor, calculate_levers, sim_input, scenario_type, scenario_params, sim_output
+        )
+        result = _build_result(scenario_type, scenario_params, sim_output, levers, total_expenses)
+        return index, result
+    
+    pending = [asyncio.ensure_future(scenario_result(i)) for i in range(len(scenario_jobs))]
+    try:
+        results: list[Optional[dict]] = [None] * len(scenario_jobs)
+        for next_result in asyncio.as_completed(pending):
+            index, result = await next_result
+            results[index] = result
+            queue.put_nowait(result)
+        
+        # The request's session is closed once the response starts, so use our own
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await _store_results(snapshot, results, session)
+    except Exception as e:
+        print(f"Failed to complete streamed simulation: {e}")
+        # Stop the other scenarios and collect their outcomes so none go unretrieved
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        queue.put_nowait({"error": str(e)})
+    finally:
+        queue.put_nowait(None)
+
+
+async def _stream_results(queue: asyncio.Queue) -> AsyncIterator[bytes]:
+    """Yield queued payloads as NDJSON lines until the None end marker."""
+    while (payload := await queue.get()) is not None:
+        yield orjson.dumps(payload) + b"\n"
+
 
 @router.post("", response_model=SimulationResponse)
 async def run_simulation(
     request: SimulationRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Run financial stress simulations for a snapshot.
@@ -24,72 +224,111 @@ async def run_simulation(
     If scenarios are not specified, runs all default scenarios.
     """
     # Get the snapshot
-    snapshot = session.get(Snapshot, request.snapshot_id)
+    snapshot = await session.get(Snapshot, request.snapshot_id)
     if not snapshot:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     
-    # Prepare simulation input
-    sim_input = SimulationInput(
-        monthly_income_takehome=snapshot.monthly_income_takehome,
-        emergency_fund_balance=snapshot.emergency_fund_balance,
-        essential_total=snapshot.essential_total,
-        discretionary_total=snapshot.discretionary_total,
-        horizon_months=12
+    # Payload is already dumped; return it directly to skip re-validation
+    return ORJSONResponse(content=await _run_scenarios(snapshot, request.scenarios, session))
+
+
+@router.post("/stream")
+async def stream_simulation(
+    request: SimulationRequest,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Run simulations for a snapshot, streaming results as NDJSON.
+    
+    Each line is one SimulationResult, sent as soon as that scenario is
+    done, so clients can render the first scenario without waiting for all.
+    If a scenario or storing the runs fails, the last line is
+    {"error": ...} and nothing is stored.
+    """
+    snapshot = await session.get(Snapshot, request.snapshot_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    
+    # Resolve and simulate before streaming starts, so bad scenarios fail
+    # with an error status rather than an empty 200 body
+    sim_input, scenario_jobs, sim_outputs = _prepare_scenarios(snapshot, request.scenarios)
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(
+        _compute_and_store_streamed(snapshot, sim_input, scenario_jobs, sim_outputs, queue)
     )
+    # Keep a reference until done; the event loop only holds tasks weakly
+    _stream_tasks.add(task)
+    task.add_done_callback(_stream_tasks.discard)
     
-    # Determine which scenarios to run
-    scenarios_to_run = request.scenarios if request.scenarios else get_default_scenarios()
+    return StreamingResponse(_stream_results(queue), media_type="application/x-ndjson")
+
+
+def _prune_finished_tasks() -> None:
+    """Forget finished jobs that have expired or exceed the retention cap."""
+    now = time.monotonic()
+    while _finished_task_expiry:
+        task_id, expires_at = next(iter(_finished_task_expiry.items()))
+        if expires_at > now and len(_finished_task_expiry) <= _MAX_FINISHED_TASKS:
+            break
+        del _finished_task_expiry[task_id]
+        _simulation_tasks.pop(task_id, None)
+
+
+async def _run_simulation_task(
+    task_id: UUID,
+    snapshot: Snapshot,
+    scenarios: Optional[list[dict]]
+) -> None:
+    """Run a background simulation job and record its outcome."""
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            response = await _run_scenarios(snapshot, scenarios, session)
+        _simulation_tasks[task_id] = {"status": "completed", "result": response}
+    except Exception as e:
+        _simulation_tasks[task_id] = {"status": "failed", "error": str(e)}
     
-    # Run simulations
-    results = []
-    for scenario in scenarios_to_run:
-        scenario_type = scenario["type"]
-        custom_params = scenario.get("params", {})
-        
-        # Get final params (merge custom with defaults)
-        scenario_params = get_scenario_params(scenario_type, custom_params)
-        
-        # Run simulation
-        simulator = FinancialSimulator(sim_input)
-        sim_output = simulator.simulate(scenario_type, scenario_params)
-        
-        # Calculate risk level
-        total_expenses = snapshot.essential_total + snapshot.discretionary_total
-        risk_level = calculate_risk_level(sim_output.runway_months, total_expenses)
-        
-        # Calculate levers
-        levers = calculate_levers(sim_input, scenario_type, scenario_params, sim_output.runway_months)
-        
-        # Create result
-        result = SimulationResult(
-            scenario_type=scenario_type,
-            scenario_params=scenario_params,
-            runway_months=round(sim_output.runway_months, 2),
-            breach_month=sim_output.breach_month,
-            balance_series=[round(b, 2) for b in sim_output.balance_series],
-            risk_level=risk_level,
-            min_balance=round(sim_output.min_balance, 2),
-            ending_balance=round(sim_output.ending_balance, 2),
-            top_levers=levers
-        )
-        
-        results.append(result)
-        
-        # Save to database
-        sim_run = SimulationRun(
-            snapshot_id=snapshot.id,
-            scenario_type=scenario_type,
-            scenario_params_json=scenario_params,
-            results_json=result.model_dump()
-        )
-        session.add(sim_run)
+    _finished_task_expiry[task_id] = time.monotonic() + _FINISHED_TASK_TTL_SECONDS
+    _prune_finished_tasks()
+
+
+@router.post("/jobs", status_code=202)
+async def start_simulation_job(
+    request: SimulationRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Start simulations for a snapshot in the background.
     
-    session.commit()
+    Returns 202 Accepted right away with a status URL to poll for results.
+    """
+    snapshot = await session.get(Snapshot, request.snapshot_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
     
-    return SimulationResponse(
-        snapshot_id=snapshot.id,
-        results=results
-    )
+    task_id = uuid4()
+    _simulation_tasks[task_id] = {"status": "processing"}
+    background_tasks.add_task(_run_simulation_task, task_id, snapshot, request.scenarios)
+    
+    return {
+        "task_id": task_id,
+        "status": "processing",
+        "status_url": http_request.app.url_path_for(
+            "get_simulation_status", task_id=str(task_id)
+        ),
+    }
+
+
+@router.get("/status/{task_id}")
+async def get_simulation_status(task_id: UUID):
+    """Get the status (and results, once completed) of a background simulation job."""
+    _prune_finished_tasks()
+    task = _simulation_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Simulation task not found")
+    return {"task_id": task_id, **task}
 
 
 @router.get("/scenarios")
@@ -98,31 +337,27 @@ async def list_scenarios():
     return {"scenarios": get_default_scenarios()}
 
 
-@router.get("/snapshots/{snapshot_id}/results")
+@router.get("/snapshots/{snapshot_id}/results", response_model=SimulationResponse)
 async def get_snapshot_results(
     snapshot_id: UUID,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Get all simulation results for a snapshot."""
     # Verify snapshot exists
-    snapshot = session.get(Snapshot, snapshot_id)
+    snapshot = await session.get(Snapshot, snapshot_id)
     if not snapshot:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     
-    # Get all runs for this snapshot
-    statement = select(SimulationRun).where(
+    # Get stored results for this snapshot (JSON column only, no ORM rows)
+    statement = select(SimulationRun.results_json).where(
         SimulationRun.snapshot_id == snapshot_id
     ).order_by(SimulationRun.created_at.desc())
     
-    runs = session.exec(statement).all()
+    rows = (await session.exec(statement)).all()
     
-    # Convert to response format
-    results = []
-    for run in runs:
-        result = SimulationResult(**run.results_json)
-        results.append(result)
-    
-    return SimulationResponse(
-        snapshot_id=snapshot_id,
-        results=results
-    )
+    # Stored results were written from SimulationResult fields; return them
+    # as-is instead of re-validating each one through the model
+    return ORJSONResponse(content={
+        "snapshot_id": str(snapshot_id),
+        "results": [unpack_results_json(results_json) for results_json in rows],
+    })
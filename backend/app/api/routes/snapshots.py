@@ -1,11 +1,12 @@
 """Snapshots API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
 
 from app.core.db import get_session
 from app.models.snapshot import Snapshot, SnapshotCreate, SnapshotResponse
-from app.services.col_client import COLClient
+from app.services.col_client import COLClient, get_col_client
 
 router = APIRouter(prefix="/snapshots", tags=["snapshots"])
 
@@ -13,7 +14,8 @@ router = APIRouter(prefix="/snapshots", tags=["snapshots"])
 @router.post("", response_model=SnapshotResponse, status_code=201)
 async def create_snapshot(
     snapshot_data: SnapshotCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    col_client: COLClient = Depends(get_col_client)
 ):
     """
     Create a new financial snapshot.
@@ -21,22 +23,23 @@ async def create_snapshot(
     If use_col_baseline is True and essential_total is not provided,
     the essential costs will be auto-filled from Cost of Living data.
     """
-    # Fetch COL profile
-    col_client = COLClient()
-    col_profile = await col_client.get_col_profile(snapshot_data.city)
-    
-    # Determine essential_total
+    # Must provide essential_total if not using COL baseline
     essential_total = snapshot_data.essential_total
-    if snapshot_data.use_col_baseline and essential_total is None:
-        # Use COL data as baseline
-        essential_total = col_profile.get("total", 2000)
-    elif essential_total is None:
-        # Must provide essential_total if not using COL baseline
+    if essential_total is None and not snapshot_data.use_col_baseline:
         raise HTTPException(
             status_code=400,
             detail="essential_total must be provided or use_col_baseline must be True"
         )
     
+    # Fetch COL profile only when COL data was asked for
+    col_profile = None
+    if snapshot_data.use_col_baseline:
+        col_profile = await col_client.get_col_profile(snapshot_data.city)
+        
+        if essential_total is None:
+            # Use COL data as baseline
+            essential_total = col_profile.get("total", 2000)
+    
     # Create snapshot
     snapshot = Snapshot(
         city=snapshot_data.city,
@@ -48,8 +51,8 @@ async def create_snapshot(
     )
     
     session.add(snapshot)
-    session.commit()
-    session.refresh(snapshot)
+    await session.commit()
+    await session.refresh(snapshot)
     
     return snapshot
 
@@ -57,10 +60,10 @@ async def create_snapshot(
 @router.get("/{snapshot_id}", response_model=SnapshotResponse)
 async def get_snapshot(
     snapshot_id: UUID,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Get a snapshot by ID."""
-    snapshot = session.get(Snapshot, snapshot_id)
+    snapshot = await session.get(Snapshot, snapshot_id)
     if not snapshot:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     return snapshot
@@ -69,9 +72,9 @@ async def get_snapshot(
 @router.get("", response_model=list[SnapshotResponse])
 async def list_snapshots(
     limit: int = 10,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """List recent snapshots."""
     statement = select(Snapshot).order_by(Snapshot.created_at.desc()).limit(limit)
-    snapshots = session.exec(statement).all()
+    snapshots = (await session.exec(statement)).all()
     return snapshots
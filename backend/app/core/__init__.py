@@ -1,5 +1,14 @@
 """Core application modules."""
 from app.core.config import get_settings, Settings
 from app.core.db import engine, init_db, get_session
+from app.core.executor import get_executor, shutdown_executor
 
-__all__ = ["get_settings", "Settings", "engine", "init_db", "get_session"]
+__all__ = [
+    "get_settings",
+    "Settings",
+    "engine",
+    "init_db",
+    "get_session",
+    "get_executor",
+    "shutdown_executor",
+]
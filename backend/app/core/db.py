@@ -1,25 +1,39 @@
 """Database connection and session management."""
-from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import get_settings
 
 settings = get_settings()
 
+
+def _async_database_url(url: str) -> str:
+    """Point plain postgresql:// URLs at the async-capable psycopg driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+psycopg://", 1)
+    return url
+
+
 # Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=True,  # Set to False in production
-    pool_pre_ping=True,
-    pool_size=5,
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    echo=settings.DEBUG_SQL,
+    # Recycle connections on a timer instead of a SELECT 1 on every checkout
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=1800,
+    pool_size=20,
     max_overflow=10,
 )
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """Initialize database tables."""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_session():
+async def get_session():
     """Dependency to get database session."""
-    with Session(engine) as session:
+    # Objects stay usable after commit without an implicit (sync) refresh
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
@@ -0,0 +1,33 @@
+"""Thread pool for simulation work kept off the event loop."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared simulation pool, creating it on first use.
+    
+    Per-scenario lever work is a fraction of a millisecond, so threads win
+    over processes: no pickling or IPC per task, and workers share the
+    in-process simulation caches.
+    """
+    global _executor
+    if _executor is None:
+        # None lets the pool default to min(32, os.cpu_count() + 4) workers
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.SIMULATION_WORKERS, thread_name_prefix="simulation"
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the simulation pool if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
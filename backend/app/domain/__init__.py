@@ -11,6 +11,10 @@ from app.domain.simulator import (
     SimulationInput,
     SimulationOutput,
     calculate_risk_level,
+    shifted_runway,
+    simulate,
+    simulate_batch,
+    simulate_cached,
 )
 from app.domain.levers import calculate_levers, Lever
 
@@ -24,6 +28,10 @@ __all__ = [
     "SimulationInput",
     "SimulationOutput",
     "calculate_risk_level",
+    "shifted_runway",
+    "simulate",
+    "simulate_batch",
+    "simulate_cached",
     "calculate_levers",
     "Lever",
 ]
@@ -1,6 +1,11 @@
 """Levers module for calculating actionable financial improvements."""
 from dataclasses import dataclass
-from app.domain.simulator import FinancialSimulator, SimulationInput
+from app.domain.simulator import (
+    SimulationInput,
+    SimulationOutput,
+    shifted_runway,
+    simulate_cached,
+)
 
 
 @dataclass
@@ -17,62 +22,58 @@ def calculate_levers(
     base_input: SimulationInput,
     scenario_type: str,
     scenario_params: dict,
-    base_runway: float
+    base_output: SimulationOutput
 ) -> list[dict]:
     """
     Calculate top actionable levers that would extend runway.
     
+    Levers that don't interact with the scenario (discretionary cuts,
+    emergency fund) are derived from the base balance path; only the
+    housing and side-income levers need a fresh simulation.
+    
     Args:
         base_input: Original simulation input
         scenario_type: The scenario being analyzed
         scenario_params: Parameters for the scenario
-        base_runway: The baseline runway months
+        base_output: The baseline simulation output for the scenario
         
     Returns:
         List of lever dictionaries, sorted by impact (delta_months)
     """
     levers = []
+    base_runway = base_output.runway_months
+    total_monthly = base_input.essential_total + base_input.discretionary_total
+    
+    # Runway is capped at the horizon, so nothing can improve on it
+    if base_runway >= base_input.horizon_months:
+        return levers
     
     # Lever 1: Cut discretionary spending by 30%
     if base_input.discretionary_total > 0:
-        modified_input = SimulationInput(
-            monthly_income_takehome=base_input.monthly_income_takehome,
-            emergency_fund_balance=base_input.emergency_fund_balance,
-            essential_total=base_input.essential_total,
-            discretionary_total=base_input.discretionary_total * 0.7,
-            horizon_months=base_input.horizon_months
-        )
-        simulator = FinancialSimulator(modified_input)
-        result = simulator.simulate(scenario_type, scenario_params)
+        new_discretionary = base_input.discretionary_total * 0.7
+        new_runway = shifted_runway(base_output, extra_monthly=base_input.discretionary_total * 0.3)
         
-        delta = result.runway_months - base_runway
+        delta = new_runway - base_runway
         if delta > 0.1:  # Only include if meaningful impact
             levers.append({
                 "label": "Cut discretionary spending by 30%",
-                "description": f"Reduce discretionary expenses from ${base_input.discretionary_total:.0f} to ${modified_input.discretionary_total:.0f}/month",
-                "new_runway_months": round(result.runway_months, 2),
+                "description": f"Reduce discretionary expenses from ${base_input.discretionary_total:.0f} to ${new_discretionary:.0f}/month",
+                "new_runway_months": round(new_runway, 2),
                 "delta_months": round(delta, 2),
                 "impact_category": "expense_reduction"
             })
     
     # Lever 2: Cut discretionary spending by 50%
     if base_input.discretionary_total > 0:
-        modified_input = SimulationInput(
-            monthly_income_takehome=base_input.monthly_income_takehome,
-            emergency_fund_balance=base_input.emergency_fund_balance,
-            essential_total=base_input.essential_total,
-            discretionary_total=base_input.discretionary_total * 0.5,
-            horizon_months=base_input.horizon_months
-        )
-        simulator = FinancialSimulator(modified_input)
-        result = simulator.simulate(scenario_type, scenario_params)
+        new_discretionary = base_input.discretionary_total * 0.5
+        new_runway = shifted_runway(base_output, extra_monthly=base_input.discretionary_total * 0.5)
         
-        delta = result.runway_months - base_runway
+        delta = new_runway - base_runway
         if delta > 0.1:
             levers.append({
                 "label": "Cut discretionary spending by 50%",
-                "description": f"Reduce discretionary expenses from ${base_input.discretionary_total:.0f} to ${modified_input.discretionary_total:.0f}/month",
-                "new_runway_months": round(result.runway_months, 2),
+                "description": f"Reduce discretionary expenses from ${base_input.discretionary_total:.0f} to ${new_discretionary:.0f}/month",
+                "new_runway_months": round(new_runway, 2),
                 "delta_months": round(delta, 2),
                 "impact_category": "expense_reduction"
             })
@@ -87,8 +88,7 @@ def calculate_levers(
             discretionary_total=base_input.discretionary_total,
             horizon_months=base_input.horizon_months
         )
-        simulator = FinancialSimulator(modified_input)
-        result = simulator.simulate(scenario_type, scenario_params)
+        result = simulate_cached(modified_input, scenario_type, scenario_params)
         
         delta = result.runway_months - base_runway
         if delta > 0.1:
@@ -111,8 +111,7 @@ def calculate_levers(
             discretionary_total=base_input.discretionary_total,
             horizon_months=base_input.horizon_months
         )
-        simulator = FinancialSimulator(modified_input)
-        result = simulator.simulate(scenario_type, scenario_params)
+        result = simulate_cached(modified_input, scenario_type, scenario_params)
         
         delta = result.runway_months - base_runway
         if delta > 0.1:
@@ -125,30 +124,20 @@ def calculate_levers(
             })
     
     # Lever 5: Increase emergency fund (if currently low)
-    months_of_expenses = base_input.emergency_fund_balance / (
-        base_input.essential_total + base_input.discretionary_total
-    )
+    months_of_expenses = base_input.emergency_fund_balance / total_monthly
     if months_of_expenses < 3:
         # Suggest building to 3 months
-        target_fund = (base_input.essential_total + base_input.discretionary_total) * 3
+        target_fund = total_monthly * 3
         increase_needed = target_fund - base_input.emergency_fund_balance
         
-        modified_input = SimulationInput(
-            monthly_income_takehome=base_input.monthly_income_takehome,
-            emergency_fund_balance=target_fund,
-            essential_total=base_input.essential_total,
-            discretionary_total=base_input.discretionary_total,
-            horizon_months=base_input.horizon_months
-        )
-        simulator = FinancialSimulator(modified_input)
-        result = simulator.simulate(scenario_type, scenario_params)
+        new_runway = shifted_runway(base_output, extra_fund=increase_needed)
         
-        delta = result.runway_months - base_runway
+        delta = new_runway - base_runway
         if delta > 0.1:
             levers.append({
                 "label": f"Build emergency fund to 3 months expenses",
                 "description": f"Increase emergency fund by ${increase_needed:.0f} (to ${target_fund:.0f} total)",
-                "new_runway_months": round(result.runway_months, 2),
+                "new_runway_months": round(new_runway, 2),
                 "delta_months": round(delta, 2),
                 "impact_category": "emergency_fund"
             })
@@ -1,6 +1,7 @@
 """Scenario definitions and configurations."""
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -63,9 +64,17 @@ DEFAULT_SCENARIOS = [
     ),
 ]
 
+# Lookup table for scenario definitions by type value
+_SCENARIOS_BY_TYPE: dict[str, ScenarioDefinition] = {s.type.value: s for s in DEFAULT_SCENARIOS}
 
+
+@lru_cache(maxsize=1)
 def get_default_scenarios() -> list[dict]:
-    """Get all default scenarios as dictionaries."""
+    """
+    Get all default scenarios as dictionaries.
+    
+    The list is built once and shared between callers; do not mutate it.
+    """
     return [
         {
             "type": scenario.type.value,
@@ -80,9 +89,7 @@ def get_default_scenarios() -> list[dict]:
 def get_scenario_params(scenario_type: str, custom_params: Optional[dict] = None) -> dict:
     """Get scenario parameters, merging custom params with defaults."""
     # Find default scenario
-    default_scenario = next(
-        (s for s in DEFAULT_SCENARIOS if s.type.value == scenario_type), None
-    )
+    default_scenario = _SCENARIOS_BY_TYPE.get(scenario_type)
     
     if not default_scenario:
         raise ValueError(f"Unknown scenario type: {scenario_type}")
@@ -1,11 +1,14 @@
 """Core simulation engine for financial stress modeling."""
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
 class SimulationInput:
-    """Input parameters for a simulation."""
+    """Input parameters for a simulation (immutable, hashable)."""
     monthly_income_takehome: float
     emergency_fund_balance: float
     essential_total: float
@@ -18,144 +21,315 @@ class SimulationOutput:
     """Output results from a simulation."""
     runway_months: float
     breach_month: Optional[int]
-    balance_series: list[float]
+    balance_series: np.ndarray
     min_balance: float
     ending_balance: float
 
 
+# Per-month (income multiplier, essential multiplier, one-time shock) arrays
+ScenarioSeries = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _no_change(months: np.ndarray, series: ScenarioSeries, params: dict) -> None:
+    """Baseline: income and expenses stay flat, no shocks."""
+
+
+def _income_change(months: np.ndarray, series: ScenarioSeries, params: dict) -> None:
+    """Job loss / income cut: income scaled from start_month onward."""
+    income_mult, _, _ = series
+    start_month = params.get("start_month", 1)
+    multiplier = params.get("income_multiplier", 1.0)
+    income_mult[months >= start_month] = multiplier
+
+
+def _rent_increase(months: np.ndarray, series: ScenarioSeries, params: dict) -> None:
+    """Rent/housing increase (assuming housing is ~30-40% of essential costs)."""
+    _, essential_mult, _ = series
+    start_month = params.get("start_month", 1)
+    increase_percent = params.get("increase_percent", 0.15)
+    # Estimate housing as 35% of essential costs
+    essential_mult[months >= start_month] = 1 + 0.35 * increase_percent
+
+
+def _one_time_emergency(months: np.ndarray, series: ScenarioSeries, params: dict) -> None:
+    """One-time expense shock in a single month."""
+    _, _, shock = series
+    shock_month = params.get("month", 1)
+    amount = params.get("amount", 1500)
+    # Match by value so float months (e.g. 3.0) behave like ints
+    shock[months == shock_month] = amount
+
+
+def _inflation_spike(months: np.ndarray, series: ScenarioSeries, params: dict) -> None:
+    """Inflation spike (compounds monthly on essential costs)."""
+    _, essential_mult, _ = series
+    monthly_rate = params.get("monthly_increase_rate", 0.05 / 12)
+    np.power(1 + monthly_rate, months, out=essential_mult)
+
+
+# Scenario type -> function that fills in its monthly series, starting from
+# flat income/expenses and no shock. Resolving the scenario once up front
+# keeps type checks and param lookups out of the balance computation.
+# Unknown types simulate with no change.
+_SCENARIO_HANDLERS: dict[str, Callable[[np.ndarray, ScenarioSeries, dict], None]] = {
+    "baseline": _no_change,
+    "job_loss": _income_change,
+    "income_cut_20": _income_change,
+    "income_cut_40": _income_change,
+    "rent_increase": _rent_increase,
+    "one_time_emergency": _one_time_emergency,
+    "inflation_spike": _inflation_spike,
+}
+
+
+def _build_scenario_series(
+    scenario_type: str,
+    scenario_params: dict,
+    horizon: int
+) -> ScenarioSeries:
+    """Allocate flat monthly series and let the scenario's handler adjust them in place."""
+    months = np.arange(1, horizon + 1)
+    series = (np.ones(horizon), np.ones(horizon), np.zeros(horizon))
+    _SCENARIO_HANDLERS.get(scenario_type, _no_change)(months, series, scenario_params)
+    return series
+
+
+def _params_key(scenario_params: dict) -> Optional[tuple]:
+    """Hashable key for scenario params, or None if a value is unhashable."""
+    params_key = tuple(sorted(scenario_params.items()))
+    try:
+        hash(params_key)
+    except TypeError:
+        return None
+    return params_key
+
+
+@lru_cache(maxsize=256)
+def _cached_scenario_series(scenario_type: str, params_key: tuple, horizon: int) -> ScenarioSeries:
+    """Build a scenario's monthly series from hashable arguments (memoized)."""
+    series = _build_scenario_series(scenario_type, dict(params_key), horizon)
+    # Cached arrays are shared between simulations, so keep them read-only
+    for array in series:
+        array.flags.writeable = False
+    return series
+
+
+def _scenario_series(scenario_type: str, scenario_params: dict, horizon: int) -> ScenarioSeries:
+    """
+    Get the (income multiplier, essential multiplier, shock) series for a scenario.
+    
+    The series don't depend on the amounts being simulated, so the baseline
+    and every lever variant of a scenario share one computation.
+    """
+    params_key = _params_key(scenario_params)
+    if params_key is None:
+        return _build_scenario_series(scenario_type, scenario_params, horizon)
+    return _cached_scenario_series(scenario_type, params_key, horizon)
+
+
+def simulate(
+    input_data: SimulationInput,
+    scenario_type: str,
+    scenario_params: dict
+) -> SimulationOutput:
+    """
+    Run a simulation for a given scenario.
+    
+    Every month's income, expenses and one-time shock are closed-form
+    functions of the month index, so the whole horizon is computed as
+    NumPy arrays and the balance path is a single cumulative sum.
+    
+    Args:
+        input_data: Financial state to simulate from
+        scenario_type: Type of scenario to simulate
+        scenario_params: Parameters specific to the scenario
+        
+    Returns:
+        SimulationOutput with results
+    """
+    series = _scenario_series(scenario_type, scenario_params, input_data.horizon_months)
+    # A single (1, T) view of each series; no need to stack a batch of one
+    return _simulate_with_arrays(input_data, *(array[np.newaxis] for array in series))[0]
+
+
+def simulate_batch(
+    input_data: SimulationInput,
+    scenarios: list[tuple[str, dict]]
+) -> list[SimulationOutput]:
+    """
+    Run several scenarios for the same input in one vectorized pass.
+    
+    The scenario series are stacked into (N scenarios, T months) arrays and
+    integrated together, so N scenarios cost a handful of NumPy calls
+    rather than N separate simulations.
+    
+    Args:
+        input_data: Financial state to simulate from
+        scenarios: (scenario_type, scenario_params) pairs
+        
+    Returns:
+        One SimulationOutput per scenario, in the same order
+    """
+    horizon = input_data.horizon_months
+    series = [
+        _scenario_series(scenario_type, scenario_params, horizon)
+        for scenario_type, scenario_params in scenarios
+    ]
+    income_mult, essential_mult, one_time_shock = (np.stack(arrays) for arrays in zip(*series))
+    return _simulate_with_arrays(input_data, income_mult, essential_mult, one_time_shock)
+
+
+def _simulate_with_arrays(
+    input_data: SimulationInput,
+    income_mult: np.ndarray,
+    essential_mult: np.ndarray,
+    one_time_shock: np.ndarray
+) -> list[SimulationOutput]:
+    """
+    Integrate balance paths for an input over (N, T) scenario series.
+    
+    Monthly cash flow is built and integrated in place inside the balance
+    array, so a run allocates just that array and one scratch array.
+    """
+    initial_balance = input_data.emergency_fund_balance
+    
+    # Balance paths, including the starting balance at month 0
+    balances = np.empty((income_mult.shape[0], income_mult.shape[1] + 1))
+    balances[:, 0] = initial_balance
+    
+    # Net cash flow: income - expenses - shock, written into months 1..T
+    flow = balances[:, 1:]
+    np.multiply(income_mult, input_data.monthly_income_takehome, out=flow)
+    expenses = np.multiply(essential_mult, input_data.essential_total)
+    expenses += input_data.discretionary_total
+    flow -= expenses
+    flow -= one_time_shock
+    
+    np.cumsum(flow, axis=1, out=flow)
+    flow += initial_balance
+    
+    # Track first breach (month 0 is the starting balance, not a breach)
+    breached = balances[:, 1:] < 0
+    breach_months = np.where(breached.any(axis=1), breached.argmax(axis=1) + 1, 0)
+    
+    # Calculate runway
+    runway_months = _calculate_runway(balances, input_data.horizon_months)
+    
+    # Convert per-scenario summaries to Python scalars in one call each
+    # instead of indexing NumPy scalars out one by one
+    return [
+        SimulationOutput(
+            runway_months=runway,
+            breach_month=breach_month or None,
+            balance_series=balance_series,
+            min_balance=min_balance,
+            ending_balance=ending_balance
+        )
+        for runway, breach_month, balance_series, min_balance, ending_balance in zip(
+            runway_months.tolist(),
+            breach_months.tolist(),
+            balances,
+            balances.min(axis=1).tolist(),
+            balances[:, -1].tolist(),
+        )
+    ]
+
+
+def _calculate_runway(balances: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Calculate runway in months (fractional) for each (N, T + 1) balance path.
+    
+    Runway is defined as how long funds last before hitting $0.
+    Uses linear interpolation for fractional months.
+    """
+    crossings = (balances[:, :-1] >= 0) & (balances[:, 1:] < 0)
+    crossed = crossings.any(axis=1)
+    
+    # Linear interpolation to find exact crossing point
+    rows = np.arange(balances.shape[0])
+    i = crossings.argmax(axis=1)
+    curr_balance = balances[rows, i]
+    decline = curr_balance - balances[rows, i + 1]
+    fraction = np.divide(curr_balance, decline, out=np.zeros_like(curr_balance), where=crossed)
+    
+    # If never breached, runway is the full horizon (or longer);
+    # if started negative, it is zero
+    return np.where(
+        crossed,
+        i + fraction,
+        np.where(balances[:, -1] >= 0, float(horizon), 0.0)
+    )
+
+
+def shifted_runway(
+    base_output: SimulationOutput,
+    extra_fund: float = 0.0,
+    extra_monthly: float = 0.0
+) -> float:
+    """
+    Calculate runway after adding a lump sum and/or a flat monthly amount.
+    
+    Changes that don't interact with the scenario (emergency fund size,
+    discretionary spending) shift the balance path by
+    extra_fund + extra_monthly * month, so the new runway follows directly
+    from the already simulated base path.
+    """
+    base_series = base_output.balance_series
+    months = np.arange(len(base_series))
+    shifted = base_series + extra_fund + extra_monthly * months
+    return float(_calculate_runway(shifted[np.newaxis], len(base_series) - 1)[0])
+
+
 class FinancialSimulator:
     """
     Core simulation engine that models financial fragility under various scenarios.
     
     This is pure domain logic - no dependencies on FastAPI, database, etc.
+    Kept as a thin wrapper that binds an input to the module-level simulate().
     """
     
     def __init__(self, input_data: SimulationInput):
-        self.income = input_data.monthly_income_takehome
-        self.initial_balance = input_data.emergency_fund_balance
-        self.essential = input_data.essential_total
-        self.discretionary = input_data.discretionary_total
-        self.horizon = input_data.horizon_months
+        self.input_data = input_data
     
     def simulate(
         self,
         scenario_type: str,
         scenario_params: dict
     ) -> SimulationOutput:
-        """
-        Run a simulation for a given scenario.
-        
-        Args:
-            scenario_type: Type of scenario to simulate
-            scenario_params: Parameters specific to the scenario
-            
-        Returns:
-            SimulationOutput with results
-        """
-        # Initialize tracking
-        balance = self.initial_balance
-        balance_series = [balance]
-        breach_month = None
-        
-        # Run month-by-month simulation
-        for month in range(1, self.horizon + 1):
-            # Calculate income for this month
-            income = self._calculate_income(month, scenario_type, scenario_params)
-            
-            # Calculate expenses for this month
-            expenses = self._calculate_expenses(month, scenario_type, scenario_params)
-            
-            # Apply one-time shocks
-            one_time_shock = self._calculate_one_time_shock(month, scenario_type, scenario_params)
-            
-            # Update balance
-            balance = balance + income - expenses - one_time_shock
-            balance_series.append(balance)
-            
-            # Track first breach
-            if breach_month is None and balance < 0:
-                breach_month = month
-        
-        # Calculate runway
-        runway_months = self._calculate_runway(balance_series)
-        
-        return SimulationOutput(
-            runway_months=runway_months,
-            breach_month=breach_month,
-            balance_series=balance_series,
-            min_balance=min(balance_series),
-            ending_balance=balance_series[-1]
-        )
-    
-    def _calculate_income(self, month: int, scenario_type: str, params: dict) -> float:
-        """Calculate income for a given month based on scenario."""
-        if scenario_type in ["job_loss", "income_cut_20", "income_cut_40"]:
-            start_month = params.get("start_month", 1)
-            multiplier = params.get("income_multiplier", 1.0)
-            
-            if month >= start_month:
-                return self.income * multiplier
-        
-        return self.income
+        """Run a simulation for a given scenario (see module-level simulate)."""
+        return simulate(self.input_data, scenario_type, scenario_params)
+
+
+@lru_cache(maxsize=512)
+def _run_sim(
+    input_data: SimulationInput,
+    scenario_type: str,
+    params_key: tuple,
+) -> SimulationOutput:
+    """Run a simulation from hashable arguments so results can be memoized."""
+    result = simulate(input_data, scenario_type, dict(params_key))
+    # Cached outputs are shared between callers, so keep them read-only
+    result.balance_series.flags.writeable = False
+    return result
+
+
+def simulate_cached(
+    input_data: SimulationInput,
+    scenario_type: str,
+    scenario_params: dict
+) -> SimulationOutput:
+    """
+    Run a simulation, reusing the result of any identical earlier run.
     
-    def _calculate_expenses(self, month: int, scenario_type: str, params: dict) -> float:
-        """Calculate total expenses for a given month based on scenario."""
-        essential = self.essential
-        discretionary = self.discretionary
-        
-        # Rent/housing increase (assuming housing is ~30-40% of essential costs)
-        if scenario_type == "rent_increase":
-            start_month = params.get("start_month", 1)
-            increase_percent = params.get("increase_percent", 0.15)
-            
-            if month >= start_month:
-                # Estimate housing as 35% of essential costs
-                housing_portion = essential * 0.35
-                housing_increase = housing_portion * increase_percent
-                essential = essential + housing_increase
-        
-        # Inflation spike (compounds monthly)
-        if scenario_type == "inflation_spike":
-            monthly_rate = params.get("monthly_increase_rate", 0.05 / 12)
-            essential = essential * ((1 + monthly_rate) ** month)
-        
-        return essential + discretionary
-    
-    def _calculate_one_time_shock(self, month: int, scenario_type: str, params: dict) -> float:
-        """Calculate one-time expense shocks."""
-        if scenario_type == "one_time_emergency":
-            shock_month = params.get("month", 1)
-            amount = params.get("amount", 1500)
-            
-            if month == shock_month:
-                return amount
-        
-        return 0.0
+    Levers and repeated requests for the same snapshot often simulate the
+    exact same input/scenario pair, so results are memoized. Parameters with
+    unhashable values are simulated without caching.
+    """
+    params_key = _params_key(scenario_params)
+    if params_key is None:
+        return simulate(input_data, scenario_type, scenario_params)
     
-    def _calculate_runway(self, balance_series: list[float]) -> float:
-        """
-        Calculate runway in months (fractional).
-        
-        Runway is defined as how long funds last before hitting $0.
-        Uses linear interpolation for fractional months.
-        """
-        for i in range(len(balance_series) - 1):
-            if balance_series[i] >= 0 and balance_series[i + 1] < 0:
-                # Linear interpolation to find exact crossing point
-                curr_balance = balance_series[i]
-                next_balance = balance_series[i + 1]
-                decline = curr_balance - next_balance
-                
-                if decline > 0:
-                    fraction = curr_balance / decline
-                    return i + fraction
-        
-        # If never breached, runway is the full horizon (or longer)
-        if balance_series[-1] >= 0:
-            return float(self.horizon)
-        
-        # If started negative
-        return 0.0
+    return _run_sim(input_data, scenario_type, params_key)
 
 
 def calculate_risk_level(runway_months: float, monthly_expenses: float) -> str:
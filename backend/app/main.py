@@ -1,14 +1,26 @@
 """Main FastAPI application."""
+import asyncio
+import sys
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import get_settings
 from app.core.db import init_db
+from app.core.executor import shutdown_executor
+from app.services.col_client import get_col_client
 from app.api.routes import health_router, snapshots_router, simulate_router
 
 settings = get_settings()
 
+# Async psycopg can't run on Windows' default Proactor event loop. Setting the
+# policy here covers `python -m app.main`; the uvicorn CLI creates its loop
+# before importing the app, so on Windows it needs --reload (which switches
+# to the selector loop itself).
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -16,11 +28,15 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting Finance Stress Simulator API...")
     print("📊 Initializing database...")
-    init_db()
+    await init_db()
     print("✅ Database initialized")
+    app.state.col_client = get_col_client()
+    await app.state.col_client.startup()
     yield
     # Shutdown
     print("👋 Shutting down...")
+    shutdown_executor()
+    await app.state.col_client.aclose()
 
 
 # Create FastAPI app
@@ -28,6 +44,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     description="Financial stress simulator with scenario modeling and actionable insights",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -1,8 +1,12 @@
 """SimulationRun model for storing simulation results."""
+import base64
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, Column, JSON
+from uuid import UUID
+import numpy as np
+from sqlalchemy import Index, text
+from sqlmodel import SQLModel, Field, Column
+from app.models.types import JSONVariant, uuid7
 
 
 class SimulationRun(SQLModel, table=True):
@@ -10,17 +14,33 @@ class SimulationRun(SQLModel, table=True):
     A simulation run represents one scenario execution for a snapshot.
     """
     __tablename__ = "simulation_runs"
+    __table_args__ = (
+        # Run history per snapshot and scenario, newest first
+        Index(
+            "ix_runs_snapshot_scenario_created",
+            "snapshot_id",
+            "scenario_type",
+            text("created_at DESC"),
+        ),
+        # GIN index for containment queries on stored results (Postgres only)
+        Index(
+            "ix_simulation_runs_results_json",
+            "results_json",
+            postgresql_using="gin",
+            postgresql_ops={"results_json": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
     
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     snapshot_id: UUID = Field(foreign_key="snapshots.id", index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     # Scenario info
-    scenario_type: str = Field(index=True)
-    scenario_params_json: dict = Field(sa_column=Column(JSON))
+    scenario_type: str
+    scenario_params_json: dict = Field(sa_column=Column(JSONVariant))
     
     # Results (stored as JSON for flexibility)
-    results_json: dict = Field(sa_column=Column(JSON))
+    results_json: dict = Field(sa_column=Column(JSONVariant))
 
 
 class SimulationRequest(SQLModel):
@@ -46,3 +66,31 @@ class SimulationResponse(SQLModel):
     """Schema for simulation response."""
     snapshot_id: UUID
     results: list[SimulationResult]
+
+
+def pack_results_json(result: dict) -> dict:
+    """
+    Prepare a dumped SimulationResult for storage in results_json.
+    
+    The balance series (already rounded to cents) is stored as base64
+    little-endian int32 cents instead of a list of JSON numbers: lossless
+    and about half the size. Series beyond the int32 range stay as a list.
+    """
+    cents = np.rint(np.asarray(result["balance_series"], dtype=float) * 100)
+    if cents.size and np.abs(cents).max() >= 2**31:
+        return result
+    
+    packed = {key: value for key, value in result.items() if key != "balance_series"}
+    packed["balance_series_b64"] = base64.b64encode(cents.astype("<i4").tobytes()).decode("ascii")
+    return packed
+
+
+def unpack_results_json(results_json: dict) -> dict:
+    """Restore a stored results_json (packed or legacy) to SimulationResult fields."""
+    if "balance_series_b64" not in results_json:
+        return results_json
+    
+    result = {key: value for key, value in results_json.items() if key != "balance_series_b64"}
+    cents = np.frombuffer(base64.b64decode(results_json["balance_series_b64"]), dtype="<i4")
+    result["balance_series"] = (cents / 100).tolist()
+    return result
@@ -1,8 +1,9 @@
 """Snapshot model for storing financial snapshots."""
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, Column, JSON
+from uuid import UUID
+from sqlmodel import SQLModel, Field, Column
+from app.models.types import JSONVariant, uuid7
 
 
 class Snapshot(SQLModel, table=True):
@@ -11,7 +12,7 @@ class Snapshot(SQLModel, table=True):
     """
     __tablename__ = "snapshots"
     
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     # Location
@@ -28,7 +29,7 @@ class Snapshot(SQLModel, table=True):
     discretionary_total: float = Field(ge=0)
     
     # Cost of Living profile (stored as JSON)
-    col_profile_json: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    col_profile_json: Optional[dict] = Field(default=None, sa_column=Column(JSONVariant))
 
 
 class SnapshotCreate(SQLModel):
@@ -0,0 +1,24 @@
+"""Shared column types and key helpers for database models."""
+import os
+import time
+from uuid import UUID
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Binary JSONB on Postgres (parsed once on write, indexable); plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    A 48-bit Unix millisecond timestamp followed by random bits, so new
+    primary keys land at the end of the B-tree index instead of at random
+    pages as uuid4 keys do.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
@@ -1,4 +1,4 @@
 """Services for external integrations."""
-from app.services.col_client import COLClient
+from app.services.col_client import COLClient, get_col_client
 
-__all__ = ["COLClient"]
+__all__ = ["COLClient", "get_col_client"]
@@ -1,12 +1,29 @@
 """Cost of Living API client service."""
-import json
+import asyncio
+import time
 import httpx
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Normalized COL field -> (alternate source key, default when both are missing)
+_COL_FIELDS: dict[str, tuple[Optional[str], float]] = {
+    "housing": ("rent", 1500),
+    "food": ("groceries", 400),
+    "transportation": (None, 150),
+    "utilities": (None, 100),
+    "healthcare": (None, 80),
+    "other": (None, 150),
+}
+
+# How often the fallback file is checked for changes
+_FALLBACK_RECHECK_SECONDS = 30.0
+
 
 class COLClient:
     """Client for fetching cost of living data."""
@@ -15,12 +32,76 @@ class COLClient:
         self.base_url = settings.COL_API_BASE_URL
         self.timeout = settings.COL_API_TIMEOUT_SECONDS
         self.fallback_path = Path(settings.COL_FALLBACK_PATH)
+        self.cache_ttl = settings.COL_CACHE_TTL_SECONDS
+        self.cache_maxsize = settings.COL_CACHE_MAXSIZE
+        self.keepalive_interval = settings.COL_API_KEEPALIVE_SECONDS
+        
+        # Live COL profiles keyed by normalized city: (expires_at, profile),
+        # kept in least-recently-used order
+        self._profile_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._profile_locks: dict[str, asyncio.Lock] = {}
+        
+        # Fallback data, parsed once and indexed by lowercased city;
+        # re-parsed only when the file's modification time changes
+        self._fallback_index: dict[str, dict] = {}
+        self._fallback_mtime: Optional[int] = None
+        self._fallback_checked_at = 0.0
+        self._fallback_lock = asyncio.Lock()
+        self._refresh_fallback_index()
+        
+        # Shared HTTP client (keep-alive connection pool), opened by startup()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+    
+    async def startup(self) -> None:
+        """
+        Open the pooled HTTP client used for all COL API requests.
+        
+        HTTP/2 is negotiated on https:// endpoints, so concurrent fetches
+        multiplex over one connection instead of opening one each. Idle
+        connections are kept for two minutes (and pinged, if configured) so
+        the first request after a quiet spell skips the handshake.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                # Fail over to fallback data quickly if the API is unreachable
+                timeout=httpx.Timeout(self.timeout, connect=2.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=10,
+                    max_connections=50,
+                    keepalive_expiry=120.0,
+                ),
+            )
+        if self.keepalive_interval > 0 and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keep_alive())
+    
+    async def _keep_alive(self) -> None:
+        """Ping the COL API periodically so proxies don't drop idle connections."""
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self._client.get("/health")
+            except Exception:
+                # Best effort only; real requests handle failures themselves
+                pass
+    
+    async def aclose(self) -> None:
+        """Stop keep-alive pings and close the underlying HTTP client, if opened."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_col_profile(self, city: str) -> dict:
         """
         Get cost of living profile for a city.
         
-        Tries to fetch from live API first, falls back to cached data.
+        Serves recent live results from an in-process TTL cache, otherwise
+        tries the live API first and falls back to cached data.
         
         Args:
             city: City name (e.g., "San Francisco, CA")
@@ -28,6 +109,47 @@ class COLClient:
         Returns:
             Dictionary with COL data including housing, food, transportation, etc.
         """
+        key = city.lower().strip()
+        profile = self._get_cached_profile(key)
+        if profile is not None:
+            return profile
+        
+        # One upstream fetch per city at a time; concurrent callers wait for it
+        lock = self._profile_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            profile = self._get_cached_profile(key)
+            if profile is not None:
+                return profile
+            
+            try:
+                profile = await self._get_col_profile_uncached(city)
+            finally:
+                # A newer caller may have mapped a fresh lock; leave that one alone
+                if self._profile_locks.get(key) is lock:
+                    del self._profile_locks[key]
+            
+            # Only cache live data so a recovered API is picked up right away
+            if profile.get("source") == "live":
+                self._profile_cache[key] = (time.monotonic() + self.cache_ttl, profile)
+                if len(self._profile_cache) > self.cache_maxsize:
+                    self._profile_cache.popitem(last=False)
+            return dict(profile)
+    
+    def _get_cached_profile(self, key: str) -> Optional[dict]:
+        """Return a copy of a cached, unexpired profile, if any."""
+        entry = self._profile_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, profile = entry
+        if time.monotonic() >= expires_at:
+            del self._profile_cache[key]
+            return None
+        self._profile_cache.move_to_end(key)
+        return dict(profile)
+    
+    async def _get_col_profile_uncached(self, city: str) -> dict:
+        """Fetch a COL profile from the live API, fallback file or generic data."""
         # Try live API first
         try:
             profile = await self._fetch_from_api(city)
@@ -39,7 +161,7 @@ class COLClient:
         
         # Fall back to cached data
         try:
-            profile = self._load_from_fallback(city)
+            profile = await self._load_from_fallback(city)
             if profile:
                 profile["source"] = "fallback"
                 return profile
@@ -51,32 +173,72 @@ class COLClient:
     
     async def _fetch_from_api(self, city: str) -> Optional[dict]:
         """Fetch from live COL API."""
+        # Outside the app lifespan (scripts, tests) open the client on demand
+        if self._client is None:
+            await self.startup()
+        
         # Note: Adjust endpoint path based on your actual COL API structure
-        url = f"{self.base_url}/api/cost-of-living/{city}"
+        response = await self._client.get(f"/api/cost-of-living/{city}")
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Normalize the response structure
-            return self._normalize_col_data(data)
+        # Normalize the response structure
+        return self._normalize_col_data(data)
     
-    def _load_from_fallback(self, city: str) -> Optional[dict]:
-        """Load from local fallback JSON file."""
-        if not self.fallback_path.exists():
-            return None
+    def _refresh_fallback_index(self) -> None:
+        """Re-index the local fallback JSON file if it changed since the last load."""
+        self._fallback_checked_at = time.monotonic()
+        try:
+            mtime = self.fallback_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
         
-        with open(self.fallback_path, "r") as f:
-            fallback_data = json.load(f)
+        if mtime == self._fallback_mtime:
+            return
         
-        # Look for city in fallback data
-        city_lower = city.lower()
-        for entry in fallback_data.get("cities", []):
-            if entry.get("city", "").lower() == city_lower:
-                return self._normalize_col_data(entry)
+        if mtime is None:
+            self._fallback_mtime = None
+            self._fallback_index = {}
+            return
         
-        return None
+        index = self._build_fallback_index()
+        if index is None:
+            # Keep serving the last good index (e.g. while the file is being
+            # rewritten); the mtime stays unrecorded so the next check retries
+            return
+        
+        self._fallback_mtime = mtime
+        self._fallback_index = index
+    
+    def _build_fallback_index(self) -> Optional[dict[str, dict]]:
+        """Parse the local fallback JSON file into a city -> profile index (None on error)."""
+        try:
+            with open(self.fallback_path, "rb") as f:
+                fallback_data = orjson.loads(f.read())
+            return {
+                entry.get("city", "").lower(): self._normalize_col_data(entry)
+                for entry in fallback_data.get("cities", [])
+            }
+        except Exception as e:
+            print(f"Failed to load fallback data: {e}")
+            return None
+    
+    async def _load_from_fallback(self, city: str) -> Optional[dict]:
+        """
+        Look up a city in the local fallback data.
+        
+        Lookups are served from memory. The file is re-checked at most every
+        _FALLBACK_RECHECK_SECONDS, in a worker thread so a re-parse never
+        blocks the event loop.
+        """
+        if time.monotonic() - self._fallback_checked_at >= _FALLBACK_RECHECK_SECONDS:
+            async with self._fallback_lock:
+                if time.monotonic() - self._fallback_checked_at >= _FALLBACK_RECHECK_SECONDS:
+                    await asyncio.to_thread(self._refresh_fallback_index)
+        
+        profile = self._fallback_index.get(city.lower())
+        # Copy so callers can't modify the shared index entry
+        return dict(profile) if profile else None
     
     def _normalize_col_data(self, data: dict) -> dict:
         """
@@ -100,24 +262,20 @@ class COLClient:
         
         # Try to extract and normalize from various structures
         # This depends on your actual COL API structure
-        normalized = {
-            "city": data.get("city", "Unknown"),
-            "housing": data.get("housing", data.get("rent", 1500)),
-            "food": data.get("food", data.get("groceries", 400)),
-            "transportation": data.get("transportation", 150),
-            "utilities": data.get("utilities", 100),
-            "healthcare": data.get("healthcare", 80),
-            "other": data.get("other", 150),
-        }
+        normalized = {"city": data.get("city", "Unknown")}
+        normalized.update({
+            field: data[field] if field in data else data.get(alt_key, default)
+            for field, (alt_key, default) in _COL_FIELDS.items()
+        })
         
-        normalized["total"] = sum([
-            normalized["housing"],
-            normalized["food"],
-            normalized["transportation"],
-            normalized["utilities"],
-            normalized["healthcare"],
-            normalized["other"],
-        ])
+        normalized["total"] = (
+            normalized["housing"]
+            + normalized["food"]
+            + normalized["transportation"]
+            + normalized["utilities"]
+            + normalized["healthcare"]
+            + normalized["other"]
+        )
         
         return normalized
     
@@ -139,3 +297,9 @@ class COLClient:
             "source": "generic",
             "note": "Using national average estimates"
         }
+
+
+@lru_cache()
+def get_col_client() -> COLClient:
+    """Get the shared COL client instance."""
+    return COLClient()
@@ -0,0 +1,45 @@
+"""Shared fixtures for API tests."""
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.db import get_session
+from app.main import app
+from app.models.snapshot import Snapshot
+
+
+class _SnapshotSession:
+    """Session stand-in that only knows a single snapshot."""
+    
+    def __init__(self, snapshot: Snapshot):
+        self.snapshot = snapshot
+    
+    async def get(self, model, snapshot_id):
+        return self.snapshot if snapshot_id == self.snapshot.id else None
+
+
+@pytest.fixture
+def snapshot():
+    """An unsaved snapshot to run simulations for."""
+    return Snapshot(
+        id=uuid4(),
+        city="Austin, TX",
+        monthly_income_takehome=5000,
+        emergency_fund_balance=10000,
+        essential_total=2500,
+        discretionary_total=1000,
+    )
+
+
+@pytest.fixture
+def client(snapshot):
+    """Test client that serves the snapshot without touching the database."""
+    async def override_session():
+        yield _SnapshotSession(snapshot)
+    
+    app.dependency_overrides[get_session] = override_session
+    
+    # No lifespan: startup would connect to the database
+    yield TestClient(app)
+    app.dependency_overrides.clear()
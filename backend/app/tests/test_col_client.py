@@ -0,0 +1,133 @@
+"""Tests for the COL client's profile cache."""
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.services.col_client import COLClient
+
+
+def _live_profile(city: str) -> dict:
+    """A normalized profile as the live API would return it."""
+    return {"city": city, "housing": 1000, "total": 1780}
+
+
+@pytest.fixture
+def client():
+    """A COL client whose live API is stubbed and counts its calls."""
+    client = COLClient()
+    client.fetch_calls = []
+    
+    async def fetch_from_api(city):
+        client.fetch_calls.append(city)
+        await asyncio.sleep(0.01)
+        return _live_profile(city)
+    
+    client._fetch_from_api = fetch_from_api
+    return client
+
+
+def test_concurrent_misses_fetch_once(client):
+    """Test that concurrent requests for one city share a single upstream fetch."""
+    async def fetch_all():
+        return await asyncio.gather(*(client.get_col_profile("Boise, ID") for _ in range(10)))
+    
+    profiles = asyncio.run(fetch_all())
+    
+    assert client.fetch_calls == ["Boise, ID"]
+    assert all(profile["source"] == "live" for profile in profiles)
+    assert client._profile_locks == {}
+
+
+def test_cached_profile_expires_after_ttl(client):
+    """Test that a cached profile is refetched once its TTL has passed."""
+    asyncio.run(client.get_col_profile("Boise, ID"))
+    asyncio.run(client.get_col_profile("Boise, ID"))
+    assert len(client.fetch_calls) == 1
+    
+    # Age the entry past its expiry
+    _, profile = client._profile_cache["boise, id"]
+    client._profile_cache["boise, id"] = (time.monotonic() - 1, profile)
+    
+    asyncio.run(client.get_col_profile("Boise, ID"))
+    assert len(client.fetch_calls) == 2
+
+
+def test_cache_evicts_least_recently_used(client):
+    """Test that the cache drops the least recently used city beyond its max size."""
+    client.cache_maxsize = 2
+    
+    async def fetch(*cities):
+        for city in cities:
+            await client.get_col_profile(city)
+    
+    # Touch Boise again so Reno is the least recently used when Tulsa arrives
+    asyncio.run(fetch("Boise, ID", "Reno, NV", "Boise, ID", "Tulsa, OK"))
+    
+    assert list(client._profile_cache) == ["boise, id", "tulsa, ok"]
+    asyncio.run(fetch("Reno, NV"))
+    assert client.fetch_calls == ["Boise, ID", "Reno, NV", "Tulsa, OK", "Reno, NV"]
+
+
+def test_fallback_and_generic_profiles_are_not_cached(client):
+    """Test that only live profiles are cached, so a recovered API is used right away."""
+    async def fetch_from_api(city):
+        client.fetch_calls.append(city)
+        raise RuntimeError("COL API down")
+    
+    client._fetch_from_api = fetch_from_api
+    
+    fallback = asyncio.run(client.get_col_profile("Austin, TX"))
+    generic = asyncio.run(client.get_col_profile("Nowhere, ZZ"))
+    asyncio.run(client.get_col_profile("Austin, TX"))
+    
+    assert fallback["source"] == "fallback"
+    assert generic["source"] == "generic"
+    assert client._profile_cache == {}
+    assert client.fetch_calls == ["Austin, TX", "Nowhere, ZZ", "Austin, TX"]
+
+
+def test_returned_profiles_are_copies(client):
+    """Test that callers can't modify the cached or fallback data."""
+    first = asyncio.run(client.get_col_profile("Boise, ID"))
+    first["housing"] = 0
+    assert asyncio.run(client.get_col_profile("Boise, ID"))["housing"] == 1000
+    
+    async def fetch_from_api(city):
+        raise RuntimeError("COL API down")
+    
+    client._fetch_from_api = fetch_from_api
+    fallback = asyncio.run(client.get_col_profile("Austin, TX"))
+    fallback["housing"] = 0
+    assert asyncio.run(client.get_col_profile("Austin, TX"))["housing"] == 1600
+
+
+def _write_fallback(path, content: bytes, mtime_ns: int) -> None:
+    """Write a fallback file with an explicit modification time."""
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_fallback_reindexes_on_change_and_keeps_last_good_index(tmp_path):
+    """Test that a changed fallback file is re-indexed, but a broken one is ignored until fixed."""
+    path = tmp_path / "col_fallback.json"
+    _write_fallback(path, b'{"cities": [{"city": "Boise, ID", "housing": 1200}]}', 10**18)
+    client = COLClient()
+    client.fallback_path = path
+    client._refresh_fallback_index()
+    assert client._fallback_index["boise, id"]["housing"] == 1200
+    
+    _write_fallback(path, b'{"cities": [{"city": "Boise, ID", "housing": 1300}]}', 10**18 + 1)
+    client._refresh_fallback_index()
+    assert client._fallback_index["boise, id"]["housing"] == 1300
+    
+    # A half-written file keeps the previous index
+    _write_fallback(path, b'{"cities": [{"city": "Boi', 10**18 + 2)
+    client._refresh_fallback_index()
+    assert client._fallback_index["boise, id"]["housing"] == 1300
+    
+    # Once the write completes, the next check picks it up even without a new mtime
+    _write_fallback(path, b'{"cities": [{"city": "Boise, ID", "housing": 1400}]}', 10**18 + 2)
+    client._refresh_fallback_index()
+    assert client._fallback_index["boise, id"]["housing"] == 1400
@@ -0,0 +1,49 @@
+"""Tests for the stored results_json format."""
+import pytest
+from app.models.run import pack_results_json, unpack_results_json
+
+
+def _result(balance_series: list[float]) -> dict:
+    """A dumped SimulationResult with the given balance series."""
+    return {
+        "scenario_type": "job_loss",
+        "scenario_params": {"start_month": 1, "income_multiplier": 0.0},
+        "runway_months": 1.5,
+        "breach_month": 2,
+        "balance_series": balance_series,
+        "risk_level": "high",
+        "min_balance": min(balance_series),
+        "ending_balance": balance_series[-1],
+        "top_levers": [],
+    }
+
+
+@pytest.mark.parametrize("balance_series", [
+    [10000.0, 6086.95, 2173.9, -1739.15, -5652.2],
+    [0.0, -0.01, -21474836.47, 21474836.47],
+    [123456.78, 123456.79, 99999.99],
+])
+def test_packed_results_round_trip(balance_series):
+    """Test that packed results, including negative balances, restore exactly."""
+    result = _result(balance_series)
+    packed = pack_results_json(result)
+    
+    assert "balance_series" not in packed
+    assert isinstance(packed["balance_series_b64"], str)
+    assert unpack_results_json(packed) == result
+
+
+def test_out_of_range_series_stays_a_list():
+    """Test that balances beyond the int32 cents range are stored as a plain list."""
+    result = _result([0.0, 21474836.48, -50000000.0])
+    packed = pack_results_json(result)
+    
+    assert packed == result
+    assert unpack_results_json(packed) == result
+
+
+def test_legacy_rows_unpack_unchanged():
+    """Test that rows stored before packing (plain balance_series list) still load."""
+    legacy = _result([5000.0, 2000.5, -1000.25])
+    
+    assert unpack_results_json(legacy) == legacy
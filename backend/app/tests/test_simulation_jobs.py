@@ -0,0 +1,50 @@
+"""Tests for background simulation jobs."""
+import pytest
+
+from app.api.routes import simulate as simulate_routes
+
+
+@pytest.fixture(autouse=True)
+def stub_jobs(monkeypatch):
+    """Run jobs without the database and with an empty job store."""
+    async def run_scenarios(snapshot, scenarios, session):
+        return {"snapshot_id": str(snapshot.id), "results": []}
+    
+    monkeypatch.setattr(simulate_routes, "_run_scenarios", run_scenarios)
+    monkeypatch.setattr(simulate_routes, "_simulation_tasks", {})
+    monkeypatch.setattr(simulate_routes, "_finished_task_expiry", simulate_routes.OrderedDict())
+
+
+def test_simulation_job_completes(client, snapshot):
+    """Test that a job is accepted with 202 and its status URL reports the result."""
+    response = client.post("/api/simulate/jobs", json={"snapshot_id": str(snapshot.id)})
+    
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "processing"
+    
+    status = client.get(job["status_url"])
+    assert status.status_code == 200
+    assert status.json()["status"] == "completed"
+    assert status.json()["result"] == {"snapshot_id": str(snapshot.id), "results": []}
+
+
+def test_finished_jobs_are_evicted(client, snapshot, monkeypatch):
+    """Test that finished jobs beyond the retention cap are forgotten, oldest first."""
+    monkeypatch.setattr(simulate_routes, "_MAX_FINISHED_TASKS", 1)
+    payload = {"snapshot_id": str(snapshot.id)}
+    
+    first = client.post("/api/simulate/jobs", json=payload).json()
+    second = client.post("/api/simulate/jobs", json=payload).json()
+    
+    assert client.get(first["status_url"]).status_code == 404
+    assert client.get(second["status_url"]).json()["status"] == "completed"
+
+
+def test_expired_jobs_are_evicted(client, snapshot, monkeypatch):
+    """Test that finished jobs are forgotten once their TTL has passed."""
+    monkeypatch.setattr(simulate_routes, "_FINISHED_TASK_TTL_SECONDS", 0.0)
+    
+    job = client.post("/api/simulate/jobs", json={"snapshot_id": str(snapshot.id)}).json()
+    
+    assert client.get(job["status_url"]).status_code == 404
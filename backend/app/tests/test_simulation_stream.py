@@ -0,0 +1,66 @@
+"""Tests for streaming simulations."""
+import orjson
+import pytest
+
+from app.api.routes import simulate as simulate_routes
+from app.domain.levers import calculate_levers
+from app.domain.scenarios import get_default_scenarios
+
+
+@pytest.fixture
+def stored_runs(monkeypatch):
+    """Collect stored results instead of writing them to the database."""
+    stored = []
+    
+    async def store_results(snapshot, results, session):
+        stored.extend(results)
+    
+    monkeypatch.setattr(simulate_routes, "_store_results", store_results)
+    return stored
+
+
+def _stream(client, snapshot) -> tuple[int, list[dict]]:
+    """POST a stream request and parse its NDJSON lines."""
+    response = client.post("/api/simulate/stream", json={"snapshot_id": str(snapshot.id)})
+    return response.status_code, [orjson.loads(line) for line in response.text.splitlines()]
+
+
+def test_stream_yields_every_scenario_and_stores_runs(client, snapshot, stored_runs):
+    """Test that each default scenario is streamed as one line and all runs are stored."""
+    status_code, lines = _stream(client, snapshot)
+    
+    scenario_types = sorted(scenario["type"] for scenario in get_default_scenarios())
+    assert status_code == 200
+    assert sorted(line["scenario_type"] for line in lines) == scenario_types
+    assert [run["scenario_type"] for run in stored_runs] == [
+        scenario["type"] for scenario in get_default_scenarios()
+    ]
+
+
+def test_stream_reports_failing_scenario(client, snapshot, stored_runs, monkeypatch):
+    """Test that a failing scenario ends the stream with an error line and stores nothing."""
+    def failing_levers(base_input, scenario_type, scenario_params, base_output):
+        if scenario_type == "job_loss":
+            raise RuntimeError("lever failure")
+        return calculate_levers(base_input, scenario_type, scenario_params, base_output)
+    
+    monkeypatch.setattr(simulate_routes, "calculate_levers", failing_levers)
+    status_code, lines = _stream(client, snapshot)
+    
+    assert status_code == 200
+    assert lines[-1] == {"error": "lever failure"}
+    assert all("scenario_type" in line for line in lines[:-1])
+    assert stored_runs == []
+
+
+def test_stream_reports_storage_failure(client, snapshot, monkeypatch):
+    """Test that a failed insert is reported after the streamed results."""
+    async def failing_store(snapshot, results, session):
+        raise RuntimeError("insert failed")
+    
+    monkeypatch.setattr(simulate_routes, "_store_results", failing_store)
+    status_code, lines = _stream(client, snapshot)
+    
+    assert status_code == 200
+    assert len(lines) == len(get_default_scenarios()) + 1
+    assert lines[-1] == {"error": "insert failed"}
@@ -1,6 +1,17 @@
 """Tests for the financial simulator."""
+from dataclasses import replace
+
 import pytest
-from app.domain.simulator import FinancialSimulator, SimulationInput, calculate_risk_level
+from app.domain.levers import calculate_levers
+from app.domain.simulator import (
+    FinancialSimulator,
+    SimulationInput,
+    calculate_risk_level,
+    shifted_runway,
+    simulate,
+    simulate_batch,
+    simulate_cached,
+)
 
 
 def test_baseline_no_shock():
@@ -84,6 +95,28 @@ def test_one_time_emergency():
     assert result.breach_month is None
 
 
+def test_one_time_emergency_float_month():
+    """Test that a whole float month applies the shock and a fractional one is ignored."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=5000,
+        emergency_fund_balance=10000,
+        essential_total=2000,
+        discretionary_total=1000,
+        horizon_months=12
+    )
+    
+    simulator = FinancialSimulator(sim_input)
+    # Float first: 3 and 3.0 share a series cache entry
+    float_month = simulator.simulate("one_time_emergency", {"month": 3.0, "amount": 1500})
+    int_month = simulator.simulate("one_time_emergency", {"month": 3, "amount": 1500})
+    fractional = simulator.simulate("one_time_emergency", {"month": 2.5, "amount": 1500})
+    baseline = simulator.simulate("baseline", {})
+    
+    assert list(float_month.balance_series) == list(int_month.balance_series)
+    assert float_month.ending_balance == baseline.ending_balance - 1500
+    assert list(fractional.balance_series) == list(baseline.balance_series)
+
+
 def test_inflation_spike():
     """Test inflation increasing costs."""
     sim_input = SimulationInput(
@@ -126,5 +159,140 @@ def test_runway_calculation_with_interpolation():
     assert result.breach_month == 4  # Should breach in month 4
 
 
+def test_runway_uses_first_crossing_when_balance_recovers():
+    """Test that runway stops at the first zero crossing even if the balance recovers."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=4000,
+        emergency_fund_balance=1000,
+        essential_total=3000,
+        discretionary_total=0,
+        horizon_months=12
+    )
+    
+    simulator = FinancialSimulator(sim_input)
+    result = simulator.simulate("one_time_emergency", {"month": 2, "amount": 5000})
+    
+    # Balance goes 1000 -> 2000 -> -2000 and then climbs back above zero
+    assert result.ending_balance > 0
+    assert result.breach_month == 2
+    assert abs(result.runway_months - 1.5) < 0.01
+
+
+def test_simulate_cached_matches_simulator():
+    """Test that cached simulations match a fresh run and are reused."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=2000,
+        emergency_fund_balance=6000,
+        essential_total=2500,
+        discretionary_total=500,
+        horizon_months=12
+    )
+    params = {"start_month": 2, "income_multiplier": 0.5}
+    
+    fresh = FinancialSimulator(sim_input).simulate("job_loss", params)
+    cached = simulate_cached(sim_input, "job_loss", params)
+    
+    assert cached.runway_months == fresh.runway_months
+    assert cached.breach_month == fresh.breach_month
+    assert list(cached.balance_series) == list(fresh.balance_series)
+    assert simulate_cached(sim_input, "job_loss", dict(params)) is cached
+
+
+def test_simulate_batch_matches_single_runs():
+    """Test that batched scenarios match running each scenario on its own."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=4000,
+        emergency_fund_balance=5000,
+        essential_total=2500,
+        discretionary_total=800,
+        horizon_months=12
+    )
+    scenarios = [
+        ("baseline", {}),
+        ("job_loss", {"start_month": 1, "income_multiplier": 0.0}),
+        ("one_time_emergency", {"month": 3, "amount": 6000}),
+        ("inflation_spike", {"monthly_increase_rate": 0.02}),
+    ]
+    
+    batch = simulate_batch(sim_input, scenarios)
+    
+    assert len(batch) == len(scenarios)
+    for (scenario_type, params), result in zip(scenarios, batch):
+        single = FinancialSimulator(sim_input).simulate(scenario_type, params)
+        assert result.runway_months == single.runway_months
+        assert result.breach_month == single.breach_month
+        assert list(result.balance_series) == list(single.balance_series)
+
+
+LEVER_SCENARIOS = [
+    ("baseline", {}),
+    ("job_loss", {"start_month": 1, "income_multiplier": 0.0}),
+    ("income_cut_40", {"start_month": 2, "income_multiplier": 0.6}),
+    ("rent_increase", {"start_month": 1, "increase_percent": 0.25}),
+    ("one_time_emergency", {"month": 3, "amount": 6000}),
+    ("inflation_spike", {"monthly_increase_rate": 0.02}),
+]
+
+
+@pytest.mark.parametrize("scenario_type,params", LEVER_SCENARIOS)
+@pytest.mark.parametrize("emergency_fund", [0, 2500, 9000])
+def test_shifted_runway_matches_full_simulation(scenario_type, params, emergency_fund):
+    """Test that derived discretionary and emergency fund levers match a re-simulation."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=3500,
+        emergency_fund_balance=emergency_fund,
+        essential_total=2800,
+        discretionary_total=900,
+        horizon_months=12
+    )
+    base = simulate(sim_input, scenario_type, params)
+    total_monthly = sim_input.essential_total + sim_input.discretionary_total
+    
+    # Lever label -> (modified input to re-simulate, runway derived from the base path)
+    variants = {}
+    for cut in (0.3, 0.5):
+        cut_discretionary = sim_input.discretionary_total * (1 - cut)
+        variants[f"Cut discretionary spending by {cut:.0%}"] = (
+            replace(sim_input, discretionary_total=cut_discretionary),
+            shifted_runway(base, extra_monthly=sim_input.discretionary_total * cut),
+        )
+    extra_fund = 3 * total_monthly - emergency_fund
+    variants["Build emergency fund to 3 months expenses"] = (
+        replace(sim_input, emergency_fund_balance=emergency_fund + extra_fund),
+        shifted_runway(base, extra_fund=extra_fund),
+    )
+    
+    for modified_input, derived in variants.values():
+        expected = simulate(modified_input, scenario_type, params).runway_months
+        assert derived == pytest.approx(expected, abs=1e-9)
+    
+    # Levers built from the derived runways report the re-simulated values
+    for lever in calculate_levers(sim_input, scenario_type, params, base):
+        if lever["label"] in variants:
+            modified = simulate(variants[lever["label"]][0], scenario_type, params)
+            assert lever["new_runway_months"] == round(modified.runway_months, 2)
+
+
+def test_no_levers_when_runway_reaches_horizon():
+    """Test that levers are skipped when no change can improve a full-horizon runway."""
+    sim_input = SimulationInput(
+        monthly_income_takehome=5000,
+        emergency_fund_balance=1000,
+        essential_total=2500,
+        discretionary_total=1000,
+        horizon_months=12
+    )
+    params = {"month": 6, "amount": 500}
+    base = simulate(sim_input, "one_time_emergency", params)
+    
+    assert base.runway_months == sim_input.horizon_months
+    assert calculate_levers(sim_input, "one_time_emergency", params, base) == []
+    
+    # A full re-simulation of a lever can't do better either
+    cut_input = replace(sim_input, discretionary_total=500)
+    cut_runway = simulate(cut_input, "one_time_emergency", params).runway_months
+    assert cut_runway == sim_input.horizon_months
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -42,7 +42,7 @@ def test_simulator():
     print("🎯 Top Recommended Actions:")
     print("-" * 50)
     
-    levers = calculate_levers(sim_input, "job_loss", scenario_params, result.runway_months)
+    levers = calculate_levers(sim_input, "job_loss", scenario_params, result)
     
     for i, lever in enumerate(levers, 1):
         print(f"{i}. {lever['label']}")